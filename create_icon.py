@@ -12,6 +12,69 @@ except ImportError:
 
 import os
 
+# Minimal 16x16 32-bit ICO (a plain blue square), used when PIL is not available
+FALLBACK_ICO_DATA = (
+    bytes([
+        # ICO header
+        0x00, 0x00, 0x01, 0x00, 0x01, 0x00,
+        # Image directory entry
+        0x10, 0x10, 0x00, 0x00, 0x01, 0x00, 0x20, 0x00,
+        0x68, 0x04, 0x00, 0x00, 0x16, 0x00, 0x00, 0x00,
+        # Bitmap header
+        0x28, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00,
+        0x20, 0x00, 0x00, 0x00, 0x01, 0x00, 0x20, 0x00,
+        0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00,
+        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+    ])
+    # Blue pixels (16x16 = 256 pixels, BGRA for #3498DB, fully opaque)
+    + b'\xdb\x98\x34\xff' * 256
+    # AND mask (all zeros for no transparency): 16 rows of 1-bit pixels padded to 4 bytes
+    + bytes(64)
+)
+
+# Icon frame sizes, largest first (the ICO is saved from the largest frame)
+ICON_SIZES = (64, 48, 32, 16)
+
+def _load_font(size):
+    """Load the first available system font, falling back to PIL's default"""
+    try:
+        # Try to use a system font
+        return ImageFont.truetype("arial.ttf", size)
+    except:
+        try:
+            return ImageFont.truetype("calibri.ttf", size)
+        except:
+            # Fallback to default font
+            return ImageFont.load_default()
+
+def _draw_icon(size, font):
+    """Draw the fallback "MD" icon natively at the given size"""
+    scale = size / 64
+    img = Image.new('RGBA', (size, size), (52, 152, 219, 255))  # Blue background
+    draw = ImageDraw.Draw(img)
+
+    # Draw white "MD" text
+    text = "MD"
+    bbox = draw.textbbox((0, 0), text, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+
+    x = (size - text_width) // 2
+    y = (size - text_height) // 2
+
+    draw.text((x, y), text, fill=(255, 255, 255, 255), font=font)
+
+    # Add a small arrow or conversion symbol
+    arrow = [(45, 15), (55, 20), (45, 25)]
+    draw.polygon([(px * scale, py * scale) for px, py in arrow], fill=(255, 255, 255, 255))  # Right arrow
+
+    return img
+
+def _save_ico(frames):
+    """Save pre-rendered frames (largest first) as a multi-size ICO"""
+    frames[0].save('icon.ico', format='ICO', sizes=[f.size for f in frames], append_images=frames[1:])
+
 def create_simple_icon():
     """Create icon from smoke.png if available, otherwise create a simple icon"""
     if not PIL_AVAILABLE:
@@ -30,11 +93,11 @@ def create_simple_icon():
             if img.mode != 'RGBA':
                 img = img.convert('RGBA')
 
-            # Create different sizes for the ICO file
-            sizes = [(16, 16), (32, 32), (48, 48), (64, 64)]
+            # Resample each size from the full-resolution source
+            frames = [img.resize((size, size), Image.Resampling.LANCZOS) for size in ICON_SIZES]
 
             # Save as ICO with multiple sizes
-            img.save('icon.ico', format='ICO', sizes=sizes)
+            _save_ico(frames)
             print("✓ Icon created from smoke.png: icon.ico")
             return True
 
@@ -44,70 +107,24 @@ def create_simple_icon():
     else:
         print("smoke.png not found, creating simple icon...")
 
-    # Fallback: Create a 64x64 image with a blue background
-    size = 64
-    img = Image.new('RGBA', (size, size), (52, 152, 219, 255))  # Blue background
-    draw = ImageDraw.Draw(img)
-
-    # Draw a simple "MD" text
-    try:
-        # Try to use a system font
-        font = ImageFont.truetype("arial.ttf", 24)
-    except:
-        try:
-            font = ImageFont.truetype("calibri.ttf", 24)
-        except:
-            # Fallback to default font
-            font = ImageFont.load_default()
-
-    # Draw white "MD" text
-    text = "MD"
-    bbox = draw.textbbox((0, 0), text, font=font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
-
-    x = (size - text_width) // 2
-    y = (size - text_height) // 2
-
-    draw.text((x, y), text, fill=(255, 255, 255, 255), font=font)
-
-    # Add a small arrow or conversion symbol
-    draw.polygon([(45, 15), (55, 20), (45, 25)], fill=(255, 255, 255, 255))  # Right arrow
+    # Fallback: draw the blue "MD" icon at each size, scaling the font with it
+    font = _load_font(24)
+    frames = []
+    for size in ICON_SIZES:
+        font_size = max(6, round(24 * size / 64))
+        frame_font = font.font_variant(size=font_size) if hasattr(font, 'font_variant') else font
+        frames.append(_draw_icon(size, frame_font))
 
     # Save as ICO
-    img.save('icon.ico', format='ICO', sizes=[(16, 16), (32, 32), (48, 48), (64, 64)])
+    _save_ico(frames)
     print("✓ Fallback icon created: icon.ico")
     return True
 
 def create_fallback_icon():
     """Create a minimal ICO file without PIL"""
-    # This is a minimal 16x16 ICO file in hex format
-    # It creates a simple blue square icon
-    ico_data = bytes([
-        # ICO header
-        0x00, 0x00, 0x01, 0x00, 0x01, 0x00,
-        # Image directory entry
-        0x10, 0x10, 0x00, 0x00, 0x01, 0x00, 0x20, 0x00,
-        0x68, 0x04, 0x00, 0x00, 0x16, 0x00, 0x00, 0x00,
-        # Bitmap header
-        0x28, 0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00,
-        0x20, 0x00, 0x00, 0x00, 0x01, 0x00, 0x20, 0x00,
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00,
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-    ])
-
-    # Add blue pixels (16x16 = 256 pixels, 4 bytes each)
-    blue_pixel = bytes([0x3498db, 0xff])  # Blue color with alpha
-    for _ in range(256):
-        ico_data += blue_pixel
-
-    # Add AND mask (all zeros for no transparency)
-    ico_data += bytes(32)  # 16x16 bits = 32 bytes
-
     try:
         with open('icon.ico', 'wb') as f:
-            f.write(ico_data)
+            f.write(FALLBACK_ICO_DATA)
         print("✓ Fallback icon created: icon.ico")
         return True
     except Exception as e:
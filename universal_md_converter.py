@@ -21,12 +21,30 @@ The application will automatically launch the GUI interface for easy file conver
 
 import os
 import sys
+import re
+import html
+import fnmatch
+import itertools
+import asyncio
+import json
+import base64
+import socket
+import struct
+import time
+import hashlib
+import functools
+import shutil
+import tempfile
 import subprocess
 import webbrowser
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import threading
+import queue
 
 # Try to import markdown, provide fallback if not available
 try:
@@ -36,160 +54,513 @@ except ImportError:
     MARKDOWN_AVAILABLE = False
     print("⚠️  Warning: 'markdown' library not found. Install with: pip install markdown")
 
+# Pygments powers syntax highlighting; its version is part of the fragment cache key
+try:
+    import pygments
+    from pygments.formatters import HtmlFormatter
+    from pygments.lexers import get_lexer_by_name
+    from pygments.util import ClassNotFound
+    PYGMENTS_AVAILABLE = True
+except ImportError:
+    PYGMENTS_AVAILABLE = False
+
+# Optional alternative backend: markdown-it-py with the plugins needed to match our extensions
+try:
+    import markdown_it
+    import mdit_py_plugins
+    from mdit_py_plugins.footnote import footnote_plugin
+    from mdit_py_plugins.deflist import deflist_plugin
+    from mdit_py_plugins.attrs import attrs_plugin
+    from mdit_py_plugins.anchors import anchors_plugin
+    MARKDOWN_IT_AVAILABLE = True
+except ImportError:
+    MARKDOWN_IT_AVAILABLE = False
+
+# On-disk cache of converted fragments: entries older than CACHE_MAX_AGE_DAYS are dropped and
+# at most CACHE_MAX_ENTRIES are kept (pruned once per converter, on its first cache write)
+CACHE_DIR = Path.home() / '.umd_cache'
+CACHE_MAX_ENTRIES = 1000
+CACHE_MAX_AGE_DAYS = 30
+
+# Timestamp format for the "Generated on ..." header line
+DATE_FORMAT = "%Y-%m-%d %H:%M"
+
+# Markdown extensions used for every conversion
+MARKDOWN_EXTENSIONS = (
+    'markdown.extensions.tables',
+    'markdown.extensions.fenced_code',
+    'markdown.extensions.toc',
+    'markdown.extensions.attr_list',
+    'markdown.extensions.def_list',
+    'markdown.extensions.footnotes'
+)
+
+# Syntax highlighting runs Pygments over every code block, so it is opt-in
+HIGHLIGHT_EXTENSIONS = MARKDOWN_EXTENSIONS + ('markdown.extensions.codehilite',)
+
+# Document stylesheet, minified once at import time and inlined into every HTML file
+_RAW_CSS = """
+    body {
+        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+        line-height: 1.6;
+        color: #333;
+        max-width: 1200px;
+        margin: 0 auto;
+        padding: 20px;
+        background-color: #fff;
+    }
+
+    h1, h2, h3, h4, h5, h6 {
+        color: #2c3e50;
+        margin-top: 1.5em;
+        margin-bottom: 0.5em;
+        font-weight: bold;
+        page-break-after: avoid;
+    }
+
+    h1 {
+        font-size: 2.2em;
+        border-bottom: 3px solid #3498db;
+        padding-bottom: 0.3em;
+    }
+
+    h2 {
+        font-size: 1.8em;
+        border-bottom: 2px solid #95a5a6;
+        padding-bottom: 0.2em;
+    }
+
+    h3 { font-size: 1.4em; color: #34495e; }
+    h4 { font-size: 1.2em; color: #34495e; }
+
+    p {
+        margin-bottom: 1em;
+        text-align: justify;
+    }
+
+    ul, ol {
+        margin-bottom: 1em;
+        padding-left: 2em;
+    }
+
+    li { margin-bottom: 0.3em; }
+
+    table {
+        border-collapse: collapse;
+        width: 100%;
+        margin: 1em 0;
+        font-size: 0.9em;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        page-break-inside: avoid;
+    }
+
+    th, td {
+        border: 1px solid #ddd;
+        padding: 12px 15px;
+        text-align: left;
+        vertical-align: top;
+    }
+
+    th {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        font-weight: bold;
+    }
+
+    tr:nth-child(even) { background-color: #f8f9fa; }
+    tr:hover { background-color: #e8f4fd; }
+
+    code {
+        background-color: #f4f4f4;
+        padding: 2px 6px;
+        border-radius: 4px;
+        font-family: 'Courier New', Consolas, monospace;
+        font-size: 0.9em;
+        color: #e74c3c;
+        border: 1px solid #e1e1e1;
+    }
+
+    pre {
+        background-color: #f8f8f8;
+        border: 1px solid #ddd;
+        border-radius: 6px;
+        padding: 1.2em;
+        overflow-x: auto;
+        margin: 1em 0;
+        box-shadow: inset 0 1px 3px rgba(0,0,0,0.1);
+        page-break-inside: avoid;
+    }
+
+    pre code {
+        background-color: transparent;
+        padding: 0;
+        color: #333;
+        border: none;
+    }
+
+    blockquote {
+        border-left: 4px solid #3498db;
+        margin: 1em 0;
+        padding: 1em 1em 1em 2em;
+        color: #666;
+        font-style: italic;
+        background-color: #f9f9f9;
+        border-radius: 0 4px 4px 0;
+    }
+
+    a {
+        color: #3498db;
+        text-decoration: none;
+        transition: color 0.3s ease;
+    }
+
+    a:hover {
+        color: #2980b9;
+        text-decoration: underline;
+    }
+
+    hr {
+        border: none;
+        border-top: 2px solid #ecf0f1;
+        margin: 2em 0;
+    }
+
+    strong, b { font-weight: bold; color: #2c3e50; }
+    em, i { font-style: italic; }
+
+    .status-complete { color: #27ae60; font-weight: bold; }
+    .status-progress { color: #f39c12; font-weight: bold; }
+    .status-pending { color: #95a5a6; font-weight: bold; }
+
+    @media print {
+        body { font-size: 12pt; line-height: 1.4; }
+        h1, h2, h3 { page-break-after: avoid; }
+        table, pre { page-break-inside: avoid; }
+    }
+
+    @media (max-width: 768px) {
+        body { padding: 10px; }
+        table { font-size: 0.8em; }
+        th, td { padding: 8px 10px; }
+    }
+    """
+
+def _minify_css(css):
+    """Strip comments and redundant whitespace from CSS"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{}:;,>])\s*', r'\1', css)
+    return css.replace(';}', '}').strip()
+
+_CSS_MINIFIED = _minify_css(_RAW_CSS)
+
+_UNDER_TO_SPACE = str.maketrans('_', ' ')
+
+@functools.lru_cache(maxsize=1024)
+def _titleize(stem):
+    """Turn a file stem like 'my_notes' into a document title ('My Notes')"""
+    return stem.translate(_UNDER_TO_SPACE).title()
+
+# Footer section (can be omitted); identical for every document
+_FOOTER_HTML = """    <div class="footer">
+        <hr>
+        <p style="text-align: center; color: #666; font-size: 0.9em;">
+            Converted with Universal Markdown Converter
+        </p>
+    </div>"""
+
+class _PythonMarkdownParser:
+    """python-markdown backend, reused across documents via reset()"""
+
+    name = 'python-markdown'
+
+    def __init__(self, extensions):
+        self.version = markdown.__version__
+        if 'markdown.extensions.codehilite' in extensions and PYGMENTS_AVAILABLE:
+            self.version += f"+pygments-{pygments.__version__}"
+        self.extensions = tuple(extensions)
+        self._md = markdown.Markdown(extensions=list(extensions))
+
+    def convert(self, md_text):
+        return self._md.reset().convert(md_text)
+
+def _pygments_highlight(code, lang, attrs):
+    """markdown-it highlight callback producing the same classes as codehilite"""
+    if not lang:
+        return ""
+    try:
+        lexer = get_lexer_by_name(lang)
+    except ClassNotFound:
+        return ""
+    body = pygments.highlight(code, lexer, HtmlFormatter(nowrap=True))
+    return f'<pre class="codehilite"><code class="language-{html.escape(lang)}">{body}</code></pre>\n'
+
+class _MarkdownItParser:
+    """markdown-it-py backend with tables, footnotes, definition lists, attributes and heading ids"""
+
+    name = 'markdown-it'
+
+    def __init__(self, highlight=False):
+        self.version = f"{markdown_it.__version__}+mdit-py-plugins-{mdit_py_plugins.__version__}"
+        self.extensions = ('table', 'strikethrough', 'footnote', 'deflist', 'attrs', 'anchors')
+        options = {}
+        if highlight and PYGMENTS_AVAILABLE:
+            self.version += f"+pygments-{pygments.__version__}"
+            self.extensions += ('highlight',)
+            options['highlight'] = _pygments_highlight
+        self._md = (
+            markdown_it.MarkdownIt('commonmark', options)
+            .enable(['table', 'strikethrough'])
+            .use(footnote_plugin)
+            .use(deflist_plugin)
+            .use(attrs_plugin)
+            .use(anchors_plugin, max_level=6)
+        )
+
+    def convert(self, md_text):
+        return self._md.render(md_text)
+
+# Markdown backends by name with their install hints; the backend is always chosen explicitly
+# so the output never depends on which optional packages happen to be installed
+MARKDOWN_BACKENDS = {
+    'python-markdown': "pip install markdown",
+    'markdown-it': "pip install markdown-it-py mdit-py-plugins",
+}
+DEFAULT_BACKEND = 'python-markdown'
+
+def available_backends():
+    """Return the names of the installed Markdown backends"""
+    installed = {'python-markdown': MARKDOWN_AVAILABLE, 'markdown-it': MARKDOWN_IT_AVAILABLE}
+    return [name for name in MARKDOWN_BACKENDS if installed[name]]
+
+def _create_parser(backend, highlight=False):
+    """Build a parser for the named backend, or None if that backend is not installed"""
+    if backend not in available_backends():
+        return None
+    if backend == 'markdown-it':
+        return _MarkdownItParser(highlight=highlight)
+    return _PythonMarkdownParser(HIGHLIGHT_EXTENSIONS if highlight else MARKDOWN_EXTENSIONS)
+
+# Headless Chrome flags; the extra switches skip extension loading and GPU/shm probing at startup
+CHROME_FLAGS = (
+    "--headless", "--disable-gpu", "--disable-dev-shm-usage",
+    "--disable-extensions", "--disable-software-rasterizer"
+)
+
+class _ChromeSession:
+    """Headless Chrome driven over the DevTools protocol, reused to print many pages"""
+
+    def __init__(self, chrome_path, timeout=30, debug=False):
+        self._timeout = timeout
+        self._next_id = 0
+        self._events = []
+        self._sock = None
+        self._user_data_dir = tempfile.mkdtemp(prefix='umd_chrome_')
+        try:
+            self._proc = subprocess.Popen(
+                [chrome_path, *CHROME_FLAGS, "--remote-debugging-port=0",
+                 "--user-data-dir=" + self._user_data_dir, "about:blank"],
+                stdout=None if debug else subprocess.DEVNULL,
+                stderr=None if debug else subprocess.DEVNULL
+            )
+        except OSError:
+            shutil.rmtree(self._user_data_dir, ignore_errors=True)
+            raise
+        try:
+            port, path = self._wait_for_devtools()
+            self._sock = self._ws_connect(port, path)
+            target_id = self._call('Target.createTarget', url='about:blank')['targetId']
+            self._session_id = self._call('Target.attachToTarget', targetId=target_id, flatten=True)['sessionId']
+            self._call('Page.enable', session=True)
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def print_to_pdf(self, html_file, pdf_file):
+        """Load an HTML file in the shared tab and save it as PDF"""
+        self._events.clear()
+        result = self._call('Page.navigate', session=True, url=Path(html_file).absolute().as_uri())
+        if result.get('errorText'):
+            raise RuntimeError(f"Chrome could not load {html_file}: {result['errorText']}")
+        self._wait_for_event('Page.loadEventFired')
+
+        data = self._call('Page.printToPDF', session=True, displayHeaderFooter=False)['data']
+        Path(pdf_file).write_bytes(base64.b64decode(data))
+
+    def close(self):
+        """Shut down Chrome and remove its temporary profile"""
+        if self._sock is not None:
+            try:
+                self._send({'id': self._next_id + 1, 'method': 'Browser.close'})
+            except OSError:
+                pass
+            self._sock.close()
+            self._sock = None
+        else:
+            # Setup failed before DevTools connected, so nothing has asked Chrome to exit
+            self._proc.terminate()
+        try:
+            self._proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+        shutil.rmtree(self._user_data_dir, ignore_errors=True)
+
+    def _wait_for_devtools(self):
+        """Wait for Chrome to publish its DevTools port and browser endpoint"""
+        port_file = Path(self._user_data_dir) / 'DevToolsActivePort'
+        deadline = time.monotonic() + self._timeout
+        while time.monotonic() < deadline:
+            if self._proc.poll() is not None:
+                raise RuntimeError("Chrome exited before DevTools became available")
+            try:
+                lines = port_file.read_text(encoding='utf-8').split()
+            except OSError:
+                lines = []
+            if len(lines) >= 2:
+                return int(lines[0]), lines[1]
+            time.sleep(0.05)
+        raise RuntimeError("Timed out waiting for Chrome DevTools")
+
+    def _call(self, method, session=False, **params):
+        """Send a DevTools command and return its result, queueing events seen meanwhile"""
+        self._next_id += 1
+        message = {'id': self._next_id, 'method': method, 'params': params}
+        if session:
+            message['sessionId'] = self._session_id
+        self._send(message)
+
+        while True:
+            reply = self._recv()
+            if reply.get('id') == self._next_id:
+                if 'error' in reply:
+                    raise RuntimeError(f"{method} failed: {reply['error'].get('message')}")
+                return reply.get('result', {})
+            if 'method' in reply:
+                self._events.append(reply)
+
+    def _wait_for_event(self, method):
+        """Block until the session receives the given DevTools event"""
+        deadline = time.monotonic() + self._timeout
+        while True:
+            for event in self._events:
+                if event['method'] == method and event.get('sessionId') == self._session_id:
+                    return event
+            self._events.clear()
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f"Timed out waiting for Chrome event {method}")
+            reply = self._recv()
+            if 'method' in reply:
+                self._events.append(reply)
+
+    # Minimal WebSocket client (RFC 6455), enough for the local DevTools endpoint
+
+    def _ws_connect(self, port, path):
+        sock = socket.create_connection(('127.0.0.1', port), timeout=self._timeout)
+        key = base64.b64encode(os.urandom(16)).decode('ascii')
+        sock.sendall((
+            f"GET {path} HTTP/1.1\r\nHost: 127.0.0.1:{port}\r\n"
+            "Upgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n"
+        ).encode('ascii'))
+
+        response = b''
+        while b'\r\n\r\n' not in response:
+            chunk = sock.recv(4096)
+            if not chunk:
+                sock.close()
+                raise ConnectionError("DevTools WebSocket handshake failed")
+            response += chunk
+        if b' 101 ' not in response.split(b'\r\n', 1)[0]:
+            sock.close()
+            raise ConnectionError("DevTools WebSocket handshake rejected")
+        return sock
+
+    def _send(self, message):
+        payload = json.dumps(message).encode('utf-8')
+        length = len(payload)
+        if length < 126:
+            header = struct.pack('!BB', 0x81, 0x80 | length)
+        elif length < (1 << 16):
+            header = struct.pack('!BBH', 0x81, 0x80 | 126, length)
+        else:
+            header = struct.pack('!BBQ', 0x81, 0x80 | 127, length)
+
+        # Client frames must be masked
+        mask = os.urandom(4)
+        mask_stream = (mask * (length // 4 + 1))[:length]
+        masked = (int.from_bytes(payload, 'big') ^ int.from_bytes(mask_stream, 'big')).to_bytes(length, 'big')
+        self._sock.sendall(header + mask + masked)
+
+    def _recv(self):
+        fragments = []
+        while True:
+            first, second = self._recv_exact(2)
+            length = second & 0x7f
+            if length == 126:
+                length = struct.unpack('!H', self._recv_exact(2))[0]
+            elif length == 127:
+                length = struct.unpack('!Q', self._recv_exact(8))[0]
+            payload = self._recv_exact(length)
+
+            opcode = first & 0x0f
+            if opcode == 0x8:
+                raise ConnectionError("DevTools connection closed")
+            if opcode in (0x9, 0xA):
+                continue
+            fragments.append(payload)
+            if first & 0x80:
+                return json.loads(b''.join(fragments))
+
+    def _recv_exact(self, size):
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        received = 0
+        while received < size:
+            count = self._sock.recv_into(view[received:])
+            if not count:
+                raise ConnectionError("DevTools connection closed")
+            received += count
+        return bytes(buffer)
+
 class MarkdownConverter:
     """Main converter class with all functionality"""
 
-    def __init__(self):
-        self.css_template = self._create_css_template()
+    CHROME_PATHS = (
+        "chrome", "google-chrome", "chromium", "chromium-browser",
+        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+    )
+
+    def __init__(self, debug=False, use_cache=True, backend=DEFAULT_BACKEND):
+        if backend not in MARKDOWN_BACKENDS:
+            raise ValueError(f"Unknown Markdown backend: {backend} (choose from {', '.join(MARKDOWN_BACKENDS)})")
+        # In debug mode Chrome's own output is kept instead of discarded
+        self.debug = debug
+        # Set use_cache to False to skip the on-disk fragment cache (CACHE_DIR)
+        self.use_cache = use_cache
+        self._cache_pruned = False
+        self.css_template = _CSS_MINIFIED
         self.html_template = self._create_html_template()
-
-    def _create_css_template(self):
-        """Create comprehensive CSS styling"""
-        return """
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #fff;
-        }
-
-        h1, h2, h3, h4, h5, h6 {
-            color: #2c3e50;
-            margin-top: 1.5em;
-            margin-bottom: 0.5em;
-            font-weight: bold;
-            page-break-after: avoid;
-        }
-
-        h1 {
-            font-size: 2.2em;
-            border-bottom: 3px solid #3498db;
-            padding-bottom: 0.3em;
-        }
-
-        h2 {
-            font-size: 1.8em;
-            border-bottom: 2px solid #95a5a6;
-            padding-bottom: 0.2em;
-        }
-
-        h3 { font-size: 1.4em; color: #34495e; }
-        h4 { font-size: 1.2em; color: #34495e; }
-
-        p {
-            margin-bottom: 1em;
-            text-align: justify;
-        }
-
-        ul, ol {
-            margin-bottom: 1em;
-            padding-left: 2em;
-        }
-
-        li { margin-bottom: 0.3em; }
-
-        table {
-            border-collapse: collapse;
-            width: 100%;
-            margin: 1em 0;
-            font-size: 0.9em;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            page-break-inside: avoid;
-        }
-
-        th, td {
-            border: 1px solid #ddd;
-            padding: 12px 15px;
-            text-align: left;
-            vertical-align: top;
-        }
-
-        th {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            font-weight: bold;
-        }
-
-        tr:nth-child(even) { background-color: #f8f9fa; }
-        tr:hover { background-color: #e8f4fd; }
-
-        code {
-            background-color: #f4f4f4;
-            padding: 2px 6px;
-            border-radius: 4px;
-            font-family: 'Courier New', Consolas, monospace;
-            font-size: 0.9em;
-            color: #e74c3c;
-            border: 1px solid #e1e1e1;
-        }
-
-        pre {
-            background-color: #f8f8f8;
-            border: 1px solid #ddd;
-            border-radius: 6px;
-            padding: 1.2em;
-            overflow-x: auto;
-            margin: 1em 0;
-            box-shadow: inset 0 1px 3px rgba(0,0,0,0.1);
-            page-break-inside: avoid;
-        }
-
-        pre code {
-            background-color: transparent;
-            padding: 0;
-            color: #333;
-            border: none;
-        }
-
-        blockquote {
-            border-left: 4px solid #3498db;
-            margin: 1em 0;
-            padding: 1em 1em 1em 2em;
-            color: #666;
-            font-style: italic;
-            background-color: #f9f9f9;
-            border-radius: 0 4px 4px 0;
-        }
-
-        a {
-            color: #3498db;
-            text-decoration: none;
-            transition: color 0.3s ease;
-        }
-
-        a:hover {
-            color: #2980b9;
-            text-decoration: underline;
-        }
-
-        hr {
-            border: none;
-            border-top: 2px solid #ecf0f1;
-            margin: 2em 0;
-        }
-
-        strong, b { font-weight: bold; color: #2c3e50; }
-        em, i { font-style: italic; }
-
-        .status-complete { color: #27ae60; font-weight: bold; }
-        .status-progress { color: #f39c12; font-weight: bold; }
-        .status-pending { color: #95a5a6; font-weight: bold; }
-
-        @media print {
-            body { font-size: 12pt; line-height: 1.4; }
-            h1, h2, h3 { page-break-after: avoid; }
-            table, pre { page-break-inside: avoid; }
-        }
-
-        @media (max-width: 768px) {
-            body { padding: 10px; }
-            table { font-size: 0.8em; }
-            th, td { padding: 8px 10px; }
-        }
-        """
+        self._html_parts = self._split_html_template(self.css_template)
+        self._highlight_html_parts = None  # adds the Pygments stylesheet, built on first use
+        # On-disk cache of converted fragments, keyed by source content hash
+        self._cache_dir = CACHE_DIR
+        # Single parser instance reused across documents; GUI conversions run in worker threads
+        self.backend = backend
+        self._parser = _create_parser(backend)
+        self._highlight_parser = None  # same backend with Pygments highlighting, created on first use
+        self._parser_lock = threading.Lock()
+        # In-process memo in front of the disk cache
+        self._convert_fragment = functools.lru_cache(maxsize=64)(self._convert_uncached)
+        self._chrome = self._detect_chrome()
 
     def _create_html_template(self):
         """Create HTML template"""
@@ -210,26 +581,135 @@ class MarkdownConverter:
 </body>
 </html>"""
 
-    def _create_header_section(self, title, date):
-        """Create header section (can be omitted)"""
+    def _split_html_template(self, css):
+        """Split the HTML template (CSS already inlined) around its per-document placeholders
+
+        The static parts are pre-encoded so they are written to disk without re-encoding.
+        """
+        template = self.html_template.replace('{css}', css)
+        parts = []
+        for marker in ('{title}', '{header_section}', '{content}', '{footer_section}'):
+            part, template = template.split(marker, 1)
+            parts.append(part.encode('utf-8'))
+        parts.append(template.encode('utf-8'))
+        return parts
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _create_header_section(title, date):
+        """Create header section (can be omitted); memoized since batch files share dates"""
         return f"""    <div class="header">
         <h1 class="document-title">{title}</h1>
         <p class="document-meta">Generated on {date} | <a href="#" onclick="window.print()">Print to PDF</a></p>
     </div>"""
 
-    def _create_footer_section(self):
-        """Create footer section (can be omitted)"""
-        return """    <div class="footer">
-        <hr>
-        <p style="text-align: center; color: #666; font-size: 0.9em;">
-            Converted with Universal Markdown Converter
-        </p>
-    </div>"""
+    def _get_html_parts(self, highlight=False):
+        """Return the pre-split template, with the Pygments stylesheet when highlighting"""
+        if not highlight or not PYGMENTS_AVAILABLE:
+            return self._html_parts
+        if self._highlight_html_parts is None:
+            pygments_css = _minify_css(HtmlFormatter().get_style_defs('.codehilite'))
+            self._highlight_html_parts = self._split_html_template(self.css_template + pygments_css)
+        return self._highlight_html_parts
+
+    def _get_parser(self, highlight=False):
+        """Return the parser for plain or syntax-highlighted output (same backend for both)"""
+        if not highlight or self._parser is None:
+            return self._parser
+        with self._parser_lock:
+            if self._highlight_parser is None:
+                self._highlight_parser = _create_parser(self.backend, highlight=True)
+            return self._highlight_parser
+
+    def _cache_key(self, md_bytes, parser):
+        """Hash the Markdown source bytes together with everything that affects its output"""
+        cache_tag = "|".join((parser.name, parser.version) + parser.extensions)
+        h = hashlib.blake2b(cache_tag.encode('utf-8'), digest_size=16)
+        h.update(md_bytes)
+        return h.hexdigest()
+
+    def _read_cache(self, key):
+        """Return a cached HTML fragment, or None on a miss"""
+        try:
+            return (self._cache_dir / f"{key}.html").read_text(encoding='utf-8')
+        except OSError:
+            return None
 
-    def convert_md_to_html(self, input_file, output_file=None, include_headers=True):
-        """Convert Markdown file to HTML"""
-        if not MARKDOWN_AVAILABLE:
-            raise ImportError("Markdown library not available. Install with: pip install markdown")
+    def _write_cache(self, key, html_content):
+        """Store an HTML fragment atomically (cache errors never fail a conversion)"""
+        if not self._cache_pruned:
+            self._cache_pruned = True
+            self._prune_cache()
+
+        tmp_file = self._cache_dir / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(html_content, encoding='utf-8')
+            os.replace(tmp_file, self._cache_dir / f"{key}.html")
+        except OSError:
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+
+    def _prune_cache(self):
+        """Drop cached fragments older than CACHE_MAX_AGE_DAYS, keeping at most CACHE_MAX_ENTRIES"""
+        entries = []
+        try:
+            with os.scandir(self._cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith('.html'):
+                        try:
+                            entries.append((entry.stat().st_mtime, entry.path))
+                        except OSError:
+                            pass
+        except OSError:
+            return
+
+        # Newest first, so everything past the entry limit is the oldest
+        entries.sort(reverse=True)
+        cutoff = time.time() - CACHE_MAX_AGE_DAYS * 24 * 3600
+        for index, (mtime, path) in enumerate(entries):
+            if index >= CACHE_MAX_ENTRIES or mtime < cutoff:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+
+    def _render_markdown(self, md_content, highlight=False):
+        """Run the Markdown pipeline on the shared parser"""
+        parser = self._get_parser(highlight)
+        with self._parser_lock:
+            return parser.convert(md_content)
+
+    def _convert_uncached(self, md_bytes, highlight=False):
+        """Convert UTF-8 Markdown source to HTML through the disk cache (when enabled)
+
+        The source is keyed on the bytes as read and only decoded when it has to be rendered.
+        """
+        if not self.use_cache:
+            return self._render_markdown(md_bytes.decode('utf-8'), highlight)
+
+        key = self._cache_key(md_bytes, self._get_parser(highlight))
+        html_content = self._read_cache(key)
+        if html_content is None:
+            html_content = self._render_markdown(md_bytes.decode('utf-8'), highlight)
+            self._write_cache(key, html_content)
+        return html_content
+
+    def _markdown_to_html(self, md_bytes, highlight=False):
+        """Convert UTF-8 Markdown source to HTML, reusing cached results for unchanged content"""
+        return self._convert_fragment(md_bytes, highlight)
+
+    def convert_md_to_html(self, input_file, output_file=None, include_headers=True, highlight=False,
+                           generated_on=None):
+        """Convert Markdown file to HTML
+
+        generated_on is the header timestamp text; it defaults to the current time.
+        """
+        if self._parser is None:
+            raise ImportError(f"Markdown backend '{self.backend}' not available. "
+                              f"Install with: {MARKDOWN_BACKENDS[self.backend]}")
 
         input_path = Path(input_file)
         if not input_path.exists():
@@ -238,84 +718,123 @@ class MarkdownConverter:
         if output_file is None:
             output_file = input_path.with_suffix('.html')
 
-        # Read Markdown content
-        with open(input_path, 'r', encoding='utf-8') as f:
-            md_content = f.read()
-
-        # Configure Markdown extensions
-        extensions = [
-            'markdown.extensions.tables',
-            'markdown.extensions.fenced_code',
-            'markdown.extensions.codehilite',
-            'markdown.extensions.toc',
-            'markdown.extensions.attr_list',
-            'markdown.extensions.def_list',
-            'markdown.extensions.footnotes'
-        ]
+        # Read Markdown source as bytes; it is hashed as read and decoded only on a cache miss
+        md_bytes = input_path.read_bytes()
 
         # Convert Markdown to HTML
-        md = markdown.Markdown(extensions=extensions)
-        html_content = md.convert(md_content)
+        html_content = self._markdown_to_html(md_bytes, highlight)
 
-        # Create complete HTML document
-        from datetime import datetime
+        title = _titleize(input_path.stem)
 
         # Conditionally include header and footer sections
         if include_headers:
             header_section = self._create_header_section(
-                input_path.stem.replace('_', ' ').title(),
-                datetime.now().strftime("%Y-%m-%d %H:%M")
+                title,
+                generated_on or datetime.now().strftime(DATE_FORMAT)
             )
-            footer_section = self._create_footer_section()
+            footer_section = _FOOTER_HTML
         else:
             header_section = ""
             footer_section = ""
 
-        full_html = self.html_template.format(
-            title=input_path.stem.replace('_', ' ').title(),
-            css=self.css_template,
-            content=html_content,
-            header_section=header_section,
-            footer_section=footer_section
-        )
-
-        # Write HTML file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(full_html)
+        # Write HTML file piece by piece instead of building the whole document in memory
+        sections = (title, header_section, html_content, footer_section)
+        html_parts = self._get_html_parts(highlight)
+        with open(output_file, 'wb', buffering=1 << 20) as f:
+            for static_part, section in zip(html_parts, sections):
+                f.write(static_part)
+                f.write(section.encode('utf-8'))
+            f.write(html_parts[-1])
 
         return str(output_file)
 
-    def html_to_pdf_chrome(self, html_file, pdf_file):
-        """Convert HTML to PDF using Chrome/Chromium"""
-        chrome_paths = [
-            "chrome", "google-chrome", "chromium", "chromium-browser",
-            r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-            r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
-            "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+    def _detect_chrome(self):
+        """Locate a Chrome/Chromium executable once (path search only, no process spawn)"""
+        for chrome_path in self.CHROME_PATHS:
+            found = shutil.which(chrome_path)
+            if found:
+                return found
+        return None
+
+    def _chrome_print_command(self, html_file, pdf_file):
+        """Build the headless Chrome command line that prints one HTML file"""
+        return [
+            self._chrome, *CHROME_FLAGS,
+            "--print-to-pdf=" + str(pdf_file),
+            "--print-to-pdf-no-header",
+            "--no-margins", str(html_file)
         ]
 
-        for chrome_path in chrome_paths:
-            try:
-                subprocess.run([chrome_path, "--version"],
-                             capture_output=True, check=True, timeout=5)
+    def html_to_pdf_chrome(self, html_file, pdf_file):
+        """Convert HTML to PDF using Chrome/Chromium"""
+        if self._chrome is None:
+            return False
 
-                cmd = [
-                    chrome_path, "--headless", "--disable-gpu",
-                    "--print-to-pdf=" + str(pdf_file),
-                    "--print-to-pdf-no-header",
-                    "--no-margins", str(html_file)
-                ]
+        cmd = self._chrome_print_command(html_file, pdf_file)
 
+        try:
+            if self.debug:
                 result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-                if result.returncode == 0:
-                    return True
+                if result.returncode != 0:
+                    print(f"⚠️  Chrome failed ({result.returncode}): {result.stderr.strip()}")
+            else:
+                result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            return False
 
-            except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-                continue
+        return result.returncode == 0
+
+    def batch_html_to_pdf(self, jobs):
+        """Print (html_file, pdf_file) pairs, sharing one Chrome process when possible
 
-        return False
+        Returns a list of booleans, one per job, telling whether the PDF was written.
+        """
+        if self._chrome is None:
+            return [False] * len(jobs)
+
+        printed = []
+        try:
+            with _ChromeSession(self._chrome, debug=self.debug) as session:
+                for html_file, pdf_file in jobs:
+                    session.print_to_pdf(html_file, pdf_file)
+                    printed.append(True)
+        except (OSError, RuntimeError, ValueError):
+            pass  # DevTools unavailable or session lost: print the rest one Chrome run per file
+
+        remaining = jobs[len(printed):]
+        if remaining:
+            printed.extend(asyncio.run(self._html_to_pdf_concurrently(remaining)))
+        return printed
+
+    async def _html_to_pdf_concurrently(self, jobs):
+        """Print each job with its own Chrome process, a few at a time"""
+        semaphore = asyncio.Semaphore(min(os.cpu_count() or 1, 4))
+        results = await asyncio.gather(
+            *(self._html_to_pdf_async(html_file, pdf_file, semaphore) for html_file, pdf_file in jobs),
+            return_exceptions=True
+        )
+        return [result is True for result in results]
+
+    async def _html_to_pdf_async(self, html_file, pdf_file, semaphore):
+        """Async counterpart of html_to_pdf_chrome, bounded by a shared semaphore"""
+        async with semaphore:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *self._chrome_print_command(html_file, pdf_file),
+                    stdout=None if self.debug else subprocess.DEVNULL,
+                    stderr=None if self.debug else subprocess.DEVNULL
+                )
+            except OSError:
+                return False
 
-    def convert_md_to_pdf(self, input_file, output_file=None, include_headers=True):
+            try:
+                return await asyncio.wait_for(proc.wait(), timeout=30) == 0
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                return False
+
+    def convert_md_to_pdf(self, input_file, output_file=None, include_headers=True, highlight=False):
         """Convert Markdown file to PDF"""
         input_path = Path(input_file)
 
@@ -323,10 +842,14 @@ class MarkdownConverter:
             output_file = input_path.with_suffix('.pdf')
 
         # Step 1: Convert to HTML
-        html_file = self.convert_md_to_html(input_file, include_headers=include_headers)
+        html_file = self.convert_md_to_html(input_file, include_headers=include_headers, highlight=highlight)
 
         # Step 2: Convert HTML to PDF
-        if self.html_to_pdf_chrome(html_file, output_file):
+        return self._finish_pdf(html_file, output_file, self.html_to_pdf_chrome(html_file, output_file))
+
+    def _finish_pdf(self, html_file, output_file, printed):
+        """Remove the intermediate HTML after printing, or keep it with instructions if Chrome failed"""
+        if printed:
             # Clean up temporary HTML file
             try:
                 os.unlink(html_file)
@@ -343,8 +866,9 @@ class MarkdownConverter:
                 pass
             return str(html_file)
 
-    def batch_convert(self, input_dir, output_dir=None, to_pdf=False, pattern="*.md", include_headers=True):
-        """Batch convert multiple files"""
+    def batch_convert(self, input_dir, output_dir=None, to_pdf=False, pattern="*.md", include_headers=True,
+                      log=print, highlight=False):
+        """Batch convert multiple files in parallel worker processes"""
         input_path = Path(input_dir)
         if not input_path.exists():
             raise ValueError(f"Input directory not found: {input_dir}")
@@ -355,35 +879,135 @@ class MarkdownConverter:
             output_path = Path(output_dir)
             output_path.mkdir(parents=True, exist_ok=True)
 
-        md_files = list(input_path.glob(pattern))
-        if not md_files:
+        # Files are discovered lazily; only enough are looked at up front to size the pool
+        md_files = _iter_sources(input_path, pattern)
+        max_workers = os.cpu_count() or 1
+        if sys.platform == 'win32':
+            max_workers = min(max_workers, 61)  # ProcessPoolExecutor rejects more on Windows
+        first_files = list(itertools.islice(md_files, max_workers))
+        if not first_files:
             return []
 
-        results = []
-        for md_file in md_files:
-            try:
-                if to_pdf:
-                    output_file = output_path / f"{md_file.stem}.pdf"
-                    result = self.convert_md_to_pdf(str(md_file), str(output_file), include_headers=include_headers)
-                else:
-                    output_file = output_path / f"{md_file.stem}.html"
-                    result = self.convert_md_to_html(str(md_file), str(output_file), include_headers=include_headers)
+        # One timestamp for the whole batch keeps the generated headers consistent
+        generated_on = datetime.now().strftime(DATE_FORMAT)
 
-                results.append(result)
-                print(f"✅ {md_file.name} → {Path(result).name}")
+        # Outputs mirror each source's subdirectory, so same-named files never share a target
+        suffix = '.pdf' if to_pdf else '.html'
 
-            except Exception as e:
-                print(f"❌ Error converting {md_file.name}: {e}")
+        def output_for(md_file):
+            target = output_path / md_file.relative_to(input_path).with_suffix(suffix)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            return target
 
-        return results
+        # Results are (discovery index, path) pairs, sorted at the end so the order does not
+        # depend on which worker finishes first
+        results = []
+        html_jobs = []
+        targets = set()
+        with ProcessPoolExecutor(max_workers=len(first_files), initializer=_init_worker,
+                                 initargs=(self.use_cache, self.backend)) as executor:
+            # Submitting while scanning lets conversion start before discovery finishes.
+            # For PDF output the HTML is an intermediate file, written next to the source
+            futures = {}
+            for index, md_file in enumerate(itertools.chain(first_files, md_files)):
+                output_file = output_for(md_file)
+                target_key = os.path.normcase(str(output_file))
+                if target_key in targets:
+                    log(f"❌ Error converting {md_file.name}: another file already writes {output_file.name}")
+                    continue
+                targets.add(target_key)
+
+                future = executor.submit(_convert_one, str(md_file), None if to_pdf else str(output_file),
+                                         include_headers, highlight, generated_on)
+                futures[future] = (index, md_file, output_file)
+
+            # Report each file as soon as its worker finishes
+            for future in as_completed(futures):
+                index, md_file, output_file = futures[future]
+                try:
+                    html_file = future.result()
+                except Exception as e:
+                    log(f"❌ Error converting {md_file.name}: {e}")
+                    continue
+
+                if to_pdf:
+                    html_jobs.append((index, md_file, html_file, str(output_file)))
+                else:
+                    results.append((index, html_file))
+                    log(f"✅ {md_file.name} → {Path(html_file).name}")
+
+        # Print all PDFs through a single Chrome session
+        if html_jobs:
+            html_jobs.sort()
+            printed = self.batch_html_to_pdf([(html_file, pdf_file) for _, _, html_file, pdf_file in html_jobs])
+            for (index, md_file, html_file, pdf_file), ok in zip(html_jobs, printed):
+                result = self._finish_pdf(html_file, pdf_file, ok)
+                results.append((index, result))
+                log(f"✅ {md_file.name} → {Path(result).name}")
+
+        return [path for _, path in sorted(results)]
+
+def _iter_sources(input_path, pattern):
+    """Yield files under input_path matching a glob pattern, without building the list up front
+
+    "*.ext" and "**/*.ext" use a plain suffix check over os.scandir/os.walk; other single-name
+    patterns use fnmatch, and anything more complex falls back to Path.glob.
+    """
+    recursive = pattern.startswith('**/')
+    name_pattern = pattern[3:] if recursive else pattern
+    if any(sep in name_pattern for sep in ('/', '\\')) or '**' in name_pattern:
+        yield from (path for path in input_path.glob(pattern) if path.is_file())
+        return
+
+    suffix = name_pattern[1:]
+    if name_pattern.startswith('*') and not any(c in suffix for c in '*?['):
+        suffix = os.path.normcase(suffix)
+        matches = lambda name: os.path.normcase(name).endswith(suffix)
+    else:
+        matches = lambda name: fnmatch.fnmatch(name, name_pattern)
+
+    if recursive:
+        for dirpath, _, filenames in os.walk(input_path):
+            for name in filenames:
+                if matches(name):
+                    yield Path(dirpath, name)
+    else:
+        with os.scandir(input_path) as entries:
+            for entry in entries:
+                if matches(entry.name) and entry.is_file():
+                    yield Path(entry.path)
+
+# Per-process converter used by batch workers
+_worker_converter = None
+
+def _init_worker(use_cache, backend):
+    """Create the converter once for each batch worker process"""
+    global _worker_converter
+    _worker_converter = MarkdownConverter(use_cache=use_cache, backend=backend)
+
+def _convert_one(input_file, output_file, include_headers, highlight, generated_on):
+    """Convert a single file to HTML inside a batch worker process"""
+    return _worker_converter.convert_md_to_html(input_file, output_file, include_headers=include_headers,
+                                                highlight=highlight, generated_on=generated_on)
+
+# Log widget batching: flush interval and number of lines kept
+LOG_FLUSH_MS = 100
+LOG_MAX_LINES = 5000
 
 class ConverterGUI:
     """Graphical User Interface for the converter"""
 
     def __init__(self):
-        self.converter = MarkdownConverter()
+        # One converter per Markdown backend so each keeps its own parsers and memo
+        self._converters = {}
         self.root = tk.Tk()
+        # Worker threads never touch Tk; they queue (level, text) messages for the GUI thread
+        self._msg_q = queue.Queue()
+        # Log lines are buffered and written to the Text widget in batches
+        self._log_buffer = []
+        self._log_flush_id = None
         self.setup_gui()
+        self.root.after(LOG_FLUSH_MS, self._drain_log)
 
     def setup_gui(self):
         """Setup the GUI interface"""
@@ -450,14 +1074,31 @@ class ConverterGUI:
         ttk.Checkbutton(output_frame, text="Remove headers (Generated on... | Print to PDF)",
                        variable=self.remove_headers).grid(row=0, column=2, sticky=tk.W, padx=(20, 0))
 
+        # Syntax highlighting option (off by default, it is slow on code-heavy documents)
+        self.highlight_code = tk.BooleanVar(value=False)
+        ttk.Checkbutton(output_frame, text="Highlight code blocks (slower)",
+                       variable=self.highlight_code).grid(row=1, column=2, sticky=tk.W, padx=(20, 0))
+
+        # On-disk cache of converted output (~/.umd_cache)
+        self.use_cache = tk.BooleanVar(value=True)
+        ttk.Checkbutton(output_frame, text="Cache converted output",
+                       variable=self.use_cache).grid(row=1, column=0, columnspan=2, sticky=tk.W)
+
         # Output directory
-        ttk.Label(output_frame, text="Output Directory:").grid(row=1, column=0, sticky=tk.W, pady=(10, 0))
+        ttk.Label(output_frame, text="Output Directory:").grid(row=2, column=0, sticky=tk.W, pady=(10, 0))
         self.output_dir_var = tk.StringVar()
         output_entry = ttk.Entry(output_frame, textvariable=self.output_dir_var, width=40)
-        output_entry.grid(row=1, column=1, padx=(10, 5), sticky=(tk.W, tk.E))
+        output_entry.grid(row=2, column=1, padx=(10, 5), sticky=(tk.W, tk.E))
 
         output_browse_btn = ttk.Button(output_frame, text="Browse", command=self.browse_output_dir)
-        output_browse_btn.grid(row=1, column=2, padx=(5, 0))
+        output_browse_btn.grid(row=2, column=2, padx=(5, 0))
+
+        # Markdown backend; only installed backends are offered
+        ttk.Label(output_frame, text="Markdown parser:").grid(row=3, column=0, sticky=tk.W, pady=(10, 0))
+        backends = available_backends() or [DEFAULT_BACKEND]
+        self.backend = tk.StringVar(value=DEFAULT_BACKEND if DEFAULT_BACKEND in backends else backends[0])
+        ttk.Combobox(output_frame, textvariable=self.backend, values=backends, state="readonly",
+                     width=20).grid(row=3, column=1, padx=(10, 5), pady=(10, 0), sticky=tk.W)
 
         # Convert buttons
         button_frame = ttk.Frame(main_frame)
@@ -477,7 +1118,7 @@ class ConverterGUI:
         log_frame = ttk.LabelFrame(main_frame, text="Log", padding="5")
         log_frame.grid(row=6, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(10, 0))
 
-        self.log_text = tk.Text(log_frame, height=10, width=70)
+        self.log_text = tk.Text(log_frame, height=10, width=70, undo=False, maxundo=0)
         scrollbar = ttk.Scrollbar(log_frame, orient="vertical", command=self.log_text.yview)
         self.log_text.configure(yscrollcommand=scrollbar.set)
 
@@ -494,10 +1135,56 @@ class ConverterGUI:
         output_frame.columnconfigure(1, weight=1)
 
     def log(self, message):
-        """Add message to log"""
-        self.log_text.insert(tk.END, message + "\n")
+        """Add message to log (buffered, written at most every LOG_FLUSH_MS)"""
+        self._log_buffer.append(message)
+        if self._log_flush_id is None:
+            self._log_flush_id = self.root.after(LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self):
+        """Write buffered log lines in one insert and drop lines beyond LOG_MAX_LINES"""
+        # Called directly (not from the timer) a flush may still be pending; it would only repeat this work
+        if self._log_flush_id is not None:
+            self.root.after_cancel(self._log_flush_id)
+            self._log_flush_id = None
+        if not self._log_buffer:
+            return
+
+        self.log_text.insert(tk.END, "\n".join(self._log_buffer) + "\n")
+        self._log_buffer.clear()
+        self.log_text.delete("1.0", f"end-{LOG_MAX_LINES}l")
         self.log_text.see(tk.END)
-        self.root.update()
+
+    def _post(self, level, text=""):
+        """Queue a message from a worker thread (level is log, info, error or done)"""
+        self._msg_q.put((level, text))
+
+    def _drain_log(self):
+        """Apply all queued worker messages on the GUI thread, then reschedule"""
+        try:
+            while True:
+                level, text = self._msg_q.get_nowait()
+                if level == "log":
+                    self.log(text)
+                    continue
+
+                # Show pending log lines before anything that changes the UI
+                self._flush_log()
+                if level == "done":
+                    self.progress.stop()
+                elif level == "error":
+                    messagebox.showerror("Error", text)
+                else:
+                    messagebox.showinfo("Success", text)
+        except queue.Empty:
+            pass
+
+        self.root.after(LOG_FLUSH_MS, self._drain_log)
+
+    def _get_converter(self, backend):
+        """Return the converter for a Markdown backend, creating it on first use"""
+        if backend not in self._converters:
+            self._converters[backend] = MarkdownConverter(backend=backend)
+        return self._converters[backend]
 
     def browse_file(self):
         """Browse for markdown file"""
@@ -526,35 +1213,43 @@ class ConverterGUI:
             messagebox.showerror("Error", "Please select a markdown file")
             return
 
-        def convert_thread():
-            try:
-                self.progress.start()
-                self.log(f"Converting {Path(self.file_var.get()).name}...")
+        # Read all Tk state here; the worker thread only posts messages back
+        input_file = self.file_var.get()
+        output_dir = self.output_dir_var.get() or str(Path(input_file).parent)
+        to_pdf = self.output_format.get() == "pdf"
+        include_headers = not self.remove_headers.get()  # Invert because checkbox is "remove"
+        highlight = self.highlight_code.get()
+        converter = self._get_converter(self.backend.get())
+        converter.use_cache = self.use_cache.get()
 
-                output_dir = self.output_dir_var.get() or str(Path(self.file_var.get()).parent)
-                include_headers = not self.remove_headers.get()  # Invert because checkbox is "remove"
+        self.progress.start()
+        self.log(f"Converting {Path(input_file).name}...")
 
-                if self.output_format.get() == "pdf":
-                    result = self.converter.convert_md_to_pdf(
-                        self.file_var.get(),
-                        str(Path(output_dir) / f"{Path(self.file_var.get()).stem}.pdf"),
-                        include_headers=include_headers
+        def convert_thread():
+            try:
+                if to_pdf:
+                    result = converter.convert_md_to_pdf(
+                        input_file,
+                        str(Path(output_dir) / f"{Path(input_file).stem}.pdf"),
+                        include_headers=include_headers,
+                        highlight=highlight
                     )
                 else:
-                    result = self.converter.convert_md_to_html(
-                        self.file_var.get(),
-                        str(Path(output_dir) / f"{Path(self.file_var.get()).stem}.html"),
-                        include_headers=include_headers
+                    result = converter.convert_md_to_html(
+                        input_file,
+                        str(Path(output_dir) / f"{Path(input_file).stem}.html"),
+                        include_headers=include_headers,
+                        highlight=highlight
                     )
 
-                self.log(f"✅ Success: {result}")
-                messagebox.showinfo("Success", f"File converted successfully!\n{result}")
+                self._post("log", f"✅ Success: {result}")
+                self._post("done")
+                self._post("info", f"File converted successfully!\n{result}")
 
             except Exception as e:
-                self.log(f"❌ Error: {e}")
-                messagebox.showerror("Error", str(e))
-            finally:
-                self.progress.stop()
+                self._post("log", f"❌ Error: {e}")
+                self._post("done")
+                self._post("error", str(e))
 
         threading.Thread(target=convert_thread, daemon=True).start()
 
@@ -564,27 +1259,33 @@ class ConverterGUI:
             messagebox.showerror("Error", "Please select a directory")
             return
 
-        def batch_thread():
-            try:
-                self.progress.start()
-                self.log(f"Batch converting directory: {self.dir_var.get()}")
+        # Read all Tk state here; the worker thread only posts messages back
+        input_dir = self.dir_var.get()
+        output_dir = self.output_dir_var.get() or input_dir
+        to_pdf = self.output_format.get() == "pdf"
+        include_headers = not self.remove_headers.get()  # Invert because checkbox is "remove"
+        highlight = self.highlight_code.get()
+        converter = self._get_converter(self.backend.get())
+        converter.use_cache = self.use_cache.get()
 
-                output_dir = self.output_dir_var.get() or self.dir_var.get()
-                to_pdf = self.output_format.get() == "pdf"
-                include_headers = not self.remove_headers.get()  # Invert because checkbox is "remove"
+        self.progress.start()
+        self.log(f"Batch converting directory: {input_dir}")
 
-                results = self.converter.batch_convert(
-                    self.dir_var.get(), output_dir, to_pdf, include_headers=include_headers
+        def batch_thread():
+            try:
+                results = converter.batch_convert(
+                    input_dir, output_dir, to_pdf, include_headers=include_headers,
+                    log=lambda message: self._post("log", message), highlight=highlight
                 )
 
-                self.log(f"✅ Batch conversion completed: {len(results)} files")
-                messagebox.showinfo("Success", f"Batch conversion completed!\n{len(results)} files converted")
+                self._post("log", f"✅ Batch conversion completed: {len(results)} files")
+                self._post("done")
+                self._post("info", f"Batch conversion completed!\n{len(results)} files converted")
 
             except Exception as e:
-                self.log(f"❌ Batch conversion error: {e}")
-                messagebox.showerror("Error", str(e))
-            finally:
-                self.progress.stop()
+                self._post("log", f"❌ Batch conversion error: {e}")
+                self._post("done")
+                self._post("error", str(e))
 
         threading.Thread(target=batch_thread, daemon=True).start()
 
@@ -671,4 +1372,6 @@ def main():
             print(f"❌ Error starting application: {e}")
 
 if __name__ == "__main__":
+    # Required for batch worker processes in the frozen Windows executable
+    multiprocessing.freeze_support()
     main()